@@ -10,7 +10,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['numba', 'llvmlite'],  # dolphin.py skips numba when frozen
     noarchive=False,
     optimize=0,
 )
@@ -4,6 +4,9 @@ Automatically reduces system volume when audio gets too loud to protect your ear
 """
 
 import sys
+import base64
+import io
+import queue
 import threading
 import time
 import tkinter as tk
@@ -11,20 +14,54 @@ import tkinter.font as tkfont
 from tkinter import ttk
 import json
 import os
+import re
 from pathlib import Path
-import winreg
 import ctypes
 from ctypes import wintypes
-from comtypes import CLSCTX_ALL
+from comtypes import CLSCTX_ALL, COMError
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume, IAudioMeterInformation
 from ctypes import cast, POINTER
+import numpy as np
+
+# Endpoint interface IDs and pointer types, resolved once for every device activation
+_IID_VOLUME = IAudioEndpointVolume._iid_
+_IID_METER = IAudioMeterInformation._iid_
+_PTR_VOLUME = POINTER(IAudioEndpointVolume)
+_PTR_METER = POINTER(IAudioMeterInformation)
+
+# 64x64 RGBA tray icon (green circle with a white "D"), pre-rendered as PNG so startup
+# decodes it instead of drawing and rasterizing text with Pillow
+_TRAY_ICON_PNG = (
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABmklEQVR42u2aPU7DQBCF304cKYUb"
+    "OmiRoOECFByBILgA4hog6JA4BqKksExBgxBUERcAmqRJkOiQkFIZkR8KenC8P96J36stz7xvZ2ZX"
+    "9gIURVEURTVVJnTA3Xx//t8ztwc3ZmkAlDFcJxATs/EQIIwG4z5BiDbzruMYTcZ9VINoNu8ivmg2"
+    "7yIP0W7eNh9ZBvM2eQkaLlmW1a+an/H58qx7jf7nAHPMkUiCu+E9Ht4eo9oeE59JfM8mOO6dAgA6"
+    "rQ7Otk/wNS3Qe3/S1wK2pV9MC1y+XmFvvRtVKwQdgsPxEGvpqr4h6GrwiWlhMptGNRCDVsDmygZG"
+    "45HubbCq0naKo61DZIM8KgBed4G2JLjYOf/dBk2CrJ/j+eMlKgAmVP/Xqb/OBDwKEwABEAABEAAB"
+    "EID1hwWNhyBWAAEQQDkAWudAmbxZAS5palt9VsCiALRUwSJ5is+Xx26eLVAVQKxVUCUvCRksNvPW"
+    "LRALBJs8pM7gdZsHHF+UDPkPwRV4iTGpkHF4V9j3ajX2trgNEO2f4SiKoihKiX4Am3ujm/InGQYA"
+    "AAAASUVORK5CYII="
+)
 
 try:
-    import pystray
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
+    import orjson
 except ImportError:
-    TRAY_AVAILABLE = False
+    orjson = None
+
+# numba is only used from source: a frozen (PyInstaller) build has no source file for its
+# on-disk cache and would recompile on every launch, so it keeps the plain Python path
+njit = None
+if not getattr(sys, 'frozen', False):
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+if njit is None:
+    def njit(*args, **kwargs):
+        """Fallback when numba is missing or the app is frozen: leave the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 
 class GlobalHotkeyListener:
@@ -144,28 +181,29 @@ class Settings:
     def load(self):
         if self.settings_file.exists():
             try:
-                with open(self.settings_file, 'r') as f:
-                    data = json.load(f)
-                    self.volume_cap = data.get('volume_cap', 0.2)
-                    self.show_close_notifications = data.get('show_close_notifications', True)
-                    self.run_at_startup = data.get('run_at_startup', False)
-                    # New settings with defaults
-                    self.attack_time = data.get('attack_time', 0.05)  # 50ms - sustained peak
-                    self.release_time = data.get('release_time', 0.5)  # 500ms
-                    self.hold_time = data.get('hold_time', 0.15)  # 150ms
-                    self.user_cooldown = data.get('user_cooldown', 2.0)  # 2s
-                    self.leeway_db = data.get('leeway_db', 3.0)  # 3dB leeway
-                    self.dampening = data.get('dampening', 1.0)  # 1x (no dampening by default)
-                    self.dampening_speed = data.get('dampening_speed', 0.0)  # 0s (instant) by default
-                    # Stabilizer settings
-                    self.stabilizer_enabled = data.get('stabilizer_enabled', False)
-                    self.stabilizer_window = data.get('stabilizer_window', 5.0)  # 5s time window
-                    self.stabilizer_threshold = data.get('stabilizer_threshold', 5)  # 5 changes trigger
-                    self.stabilizer_max_leeway = data.get('stabilizer_max_leeway', 12.0)  # Max leeway increase
-                    self.stabilizer_step = data.get('stabilizer_step', 1.0)  # dB step per adjustment
-                    self.stabilizer_change_threshold = data.get('stabilizer_change_threshold', 0.05)  # 5% change
-                    self.dark_mode = data.get('dark_mode', True)  # Dark mode by default
-                    self.mini_mode = data.get('mini_mode', False)
+                raw = self.settings_file.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self.volume_cap = data.get('volume_cap', 0.2)
+                self.show_close_notifications = data.get('show_close_notifications', True)
+                self.run_at_startup = data.get('run_at_startup', False)
+                # New settings with defaults
+                self.attack_time = data.get('attack_time', 0.05)  # 50ms - sustained peak
+                self.release_time = data.get('release_time', 0.5)  # 500ms
+                self.hold_time = data.get('hold_time', 0.15)  # 150ms
+                self.user_cooldown = data.get('user_cooldown', 2.0)  # 2s
+                self.leeway_db = data.get('leeway_db', 3.0)  # 3dB leeway
+                self.dampening = data.get('dampening', 1.0)  # 1x (no dampening by default)
+                self.dampening_speed = data.get('dampening_speed', 0.0)  # 0s (instant) by default
+                # Stabilizer settings
+                self.stabilizer_enabled = data.get('stabilizer_enabled', False)
+                self.stabilizer_window = data.get('stabilizer_window', 5.0)  # 5s time window
+                self.stabilizer_threshold = data.get('stabilizer_threshold', 5)  # 5 changes trigger
+                self.stabilizer_max_leeway = data.get('stabilizer_max_leeway', 12.0)  # Max leeway increase
+                self.stabilizer_step = data.get('stabilizer_step', 1.0)  # dB step per adjustment
+                self.stabilizer_change_threshold = data.get('stabilizer_change_threshold', 0.05)  # 5% change
+                self.dark_mode = data.get('dark_mode', True)  # Dark mode by default
+                self.mini_mode = data.get('mini_mode', False)
+                self.window_geometry = data.get('window_geometry')  # "WxH+X+Y" from the last exit
             except (OSError, ValueError):
                 self.set_defaults()
         else:
@@ -191,6 +229,7 @@ class Settings:
         self.stabilizer_change_threshold = 0.05  # 5% volume change counts
         self.dark_mode = True  # Dark mode by default
         self.mini_mode = False
+        self.window_geometry = None
     
     def save(self):
         data = {
@@ -211,10 +250,17 @@ class Settings:
             'stabilizer_step': self.stabilizer_step,
             'stabilizer_change_threshold': self.stabilizer_change_threshold,
             'dark_mode': self.dark_mode,
-            'mini_mode': self.mini_mode
+            'mini_mode': self.mini_mode,
+            'window_geometry': self.window_geometry
         }
-        with open(self.settings_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode('utf-8')
+        # Write to a temp file and swap it in so a crash never leaves a half-written settings file
+        tmp_file = self.settings_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.settings_file)
 
 
 class ToggleSwitch(tk.Canvas):
@@ -244,38 +290,56 @@ class ToggleSwitch(tk.Canvas):
         self.command = command
         self.text = text
         
+        # Create the switch items once; _draw only restyles and moves them
+        radius = self.height // 2
+        self._track_l = self.create_oval(0, 0, self.height, self.height)
+        self._track_r = self.create_oval(self.width - self.height, 0, self.width, self.height)
+        self._track_mid = self.create_rectangle(radius, 0, self.width - radius, self.height)
+        self._thumb = self.create_oval(3, 3, self.height - 3, self.height - 3, fill="white", outline="#ddd")
+        self._label = self.create_text(self.width + 10, self.height // 2,
+                text=self.text, anchor=tk.W, font=('Arial', 14))
+        self._last_state = None
+        self._draw_scheduled = False
+        
         # Draw the switch
         self._draw()
         
         # Bind click
         self.bind("<Button-1>", self._toggle)
         
-        # Track variable changes
+        # Track variable changes (coalesced into one redraw before the next paint)
         if self.variable:
-            self.variable.trace_add("write", lambda *args: self._draw())
+            self.variable.trace_add("write", lambda *args: self._request_draw())
+    
+    def _request_draw(self):
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            self.after_idle(self._do_draw)
+    
+    def _do_draw(self):
+        self._draw_scheduled = False
+        self._draw()
     
     def _draw(self):
-        self.delete("all")
-        
         is_on = self.variable.get() if self.variable else False
-        
-        # Track background (rounded rectangle)
-        radius = self.height // 2
         color = self.on_color if is_on else self.off_color
         
-        # Draw rounded track
-        self.create_oval(0, 0, self.height, self.height, fill=color, outline=color)
-        self.create_oval(self.width - self.height, 0, self.width, self.height, fill=color, outline=color)
-        self.create_rectangle(radius, 0, self.width - radius, self.height, fill=color, outline=color)
+        # Skip if nothing visible changed (theme updates change colors, so include them)
+        state = (is_on, color, self.fg_color)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        
+        # Rounded track
+        for item in (self._track_l, self._track_r, self._track_mid):
+            self.itemconfigure(item, fill=color, outline=color)
         
-        # Draw thumb (circle)
+        # Thumb (circle)
         thumb_x = self.width - self.height + 3 if is_on else 3
-        self.create_oval(thumb_x, 3, thumb_x + self.height - 6, self.height - 3, 
-                         fill="white", outline="#ddd")
+        self.coords(self._thumb, thumb_x, 3, thumb_x + self.height - 6, self.height - 3)
         
-        # Draw label text
-        self.create_text(self.width + 10, self.height // 2, 
-                text=self.text, anchor=tk.W, font=('Arial', 14), fill=self.fg_color)
+        # Label text
+        self.itemconfigure(self._label, fill=self.fg_color)
     
     def _toggle(self, event=None):
         if self.variable:
@@ -287,17 +351,21 @@ class ToggleSwitch(tk.Canvas):
 class AudioController:
     """Controls and monitors Windows system volume using cached interfaces"""
     
+    # Polled every limiter tick; fixed slots keep attribute access off the instance dict
+    __slots__ = ('_volume_ctrl', '_meter', '_cached_volume', '_last_set_volume',
+                 'user_set_time', 'user_set_volume')
+    
     def __init__(self):
         # Get audio device once and cache interfaces
         devices = AudioUtilities.GetSpeakers()
         
         # Volume control interface
-        vol_interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        self._volume_ctrl = cast(vol_interface, POINTER(IAudioEndpointVolume))
+        vol_interface = devices.Activate(_IID_VOLUME, CLSCTX_ALL, None)
+        self._volume_ctrl = cast(vol_interface, _PTR_VOLUME)
         
         # Audio meter interface for real peak levels
-        meter_interface = devices.Activate(IAudioMeterInformation._iid_, CLSCTX_ALL, None)
-        self._meter = cast(meter_interface, POINTER(IAudioMeterInformation))
+        meter_interface = devices.Activate(_IID_METER, CLSCTX_ALL, None)
+        self._meter = cast(meter_interface, _PTR_METER)
         
         self._cached_volume = self._volume_ctrl.GetMasterVolumeLevelScalar()
         self._last_set_volume = self._cached_volume
@@ -308,53 +376,118 @@ class AudioController:
         """Get current audio peak level (0.0 to 1.0) - FAST"""
         try:
             return self._meter.GetPeakValue()
-        except Exception:
+        except (COMError, OSError):
             return 0.0
     
-    def get_raw_peak(self):
-        """Get audio peak normalized to 0-1 as if volume were 100%"""
+    def snapshot(self):
+        """Get (peak, volume, raw_peak) from one meter read and the cached volume"""
+        vol = self._cached_volume
         try:
             peak = self._meter.GetPeakValue()
-            vol = self._cached_volume
-            if vol > 0.01:
-                # Normalize: if volume is 50%, peak of 0.25 means raw audio is 0.5
-                return min(1.0, peak / vol)
-            return peak
-        except Exception:
-            return 0.0
+        except (COMError, OSError):
+            return 0.0, vol, 0.0
+        if vol > 0.01:
+            # Normalize: if volume is 50%, peak of 0.25 means raw audio is 0.5
+            return peak, vol, min(1.0, peak / vol)
+        return peak, vol, peak
     
     def get_volume(self):
         """Get current system volume (0.0 to 1.0)"""
         try:
             self._cached_volume = self._volume_ctrl.GetMasterVolumeLevelScalar()
             return self._cached_volume
-        except Exception:
+        except (COMError, OSError):
             return self._cached_volume
     
-    def set_volume(self, level):
-        """Set system volume (0.0 to 1.0)"""
+    def set_volume(self, level, force=False):
+        """Set system volume (0.0 to 1.0); changes under 0.5% are skipped unless forced"""
+        level = max(0.0, min(1.0, level))
+        # Must stay below check_user_changed's 0.01 tolerance, or skipped steps would look like user changes
+        if not force and abs(level - self._last_set_volume) < 0.005:
+            return
         try:
-            level = max(0.0, min(1.0, level))
             self._volume_ctrl.SetMasterVolumeLevelScalar(level, None)
-            self._last_set_volume = level
-            self._cached_volume = level
-        except Exception:
-            pass
+        except (COMError, OSError):
+            return
+        self._last_set_volume = level
+        self._cached_volume = level
     
-    def check_user_changed(self):
-        """Check if user manually changed volume - returns True if changed"""
+    def check_user_changed(self, now=None):
+        """Check if user manually changed volume - returns True if changed (now: time.monotonic())"""
         current = self.get_volume()
         if abs(current - self._last_set_volume) > 0.01:
-            self.user_set_time = time.time()
+            self.user_set_time = time.monotonic() if now is None else now
             self.user_set_volume = current
             self._last_set_volume = current
             return True
         return False
 
 
+# Compiled eagerly (explicit signature) so the first loud peak never waits on the JIT;
+# after the first run the compiled code is loaded from numba's cache.
+@njit("float64(float64, float64, float64, float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def _limit_target(raw_peak, original_volume, volume_cap, leeway_factor,
+                  time_over_threshold, attack_time, dampening, dampening_speed):
+    """Target volume for a sustained peak (compiled with numba when available)"""
+    soft_threshold = volume_cap * leeway_factor  # Upper limit (hard cap)
+    potential_output = raw_peak * original_volume
+    
+    # Calculate how far into the leeway zone we are (0 to 1)
+    # 0 = at volume_cap, 1 = at soft_threshold (max leeway)
+    if potential_output >= soft_threshold:
+        # Beyond leeway - full limiting
+        leeway_ratio = 1.0
+    else:
+        # In leeway zone - partial limiting
+        leeway_ratio = (potential_output - volume_cap) / (soft_threshold - volume_cap)
+    
+    # Reduction is proportional to how long over threshold
+    # sustained_factor goes from 1.0 at attack_time to dampening over dampening_speed seconds
+    time_since_attack = time_over_threshold - attack_time
+    if dampening_speed > 0.001:
+        # Ramp from 1.0 to dampening over dampening_speed seconds
+        ramp_progress = min(1.0, time_since_attack / dampening_speed)
+    else:
+        # Instant dampening
+        ramp_progress = 1.0
+    sustained_factor = 1.0 + (dampening - 1.0) * ramp_progress
+    sustained_factor = max(1.0, min(dampening, sustained_factor))
+    
+    # Target volume: softer reduction in leeway zone
+    # At volume_cap: minimal reduction, at soft_threshold: full reduction
+    # Prevent division by zero with minimum threshold
+    safe_peak = max(raw_peak, 0.01)
+    base_target = volume_cap / safe_peak
+    
+    # Blend between original volume and base_target based on leeway_ratio
+    target_volume = original_volume * (1 - leeway_ratio) + base_target * leeway_ratio
+    
+    # Apply sustained factor for longer peaks (divide = more reduction)
+    target_volume = target_volume / sustained_factor
+    return max(0.01, min(1.0, target_volume))
+
+
 class VolumeLimiter:
     """Audio limiter with sustained peak detection"""
     
+    __slots__ = (
+        'settings', 'audio', 'is_running',
+        # State
+        'volume_cap', 'original_volume', 'current_peak', 'current_volume',
+        'is_limiting', 'last_over_threshold_time', 'time_over_threshold', 'peak_start_time',
+        '_silent_ticks', '_ramp_volume',
+        # Timing parameters
+        'attack_time', 'release_time', 'hold_time', 'user_cooldown', 'leeway_db',
+        'dampening', 'dampening_speed', 'release_rate', 'leeway_factor',
+        # Stabilizer
+        'stabilizer_enabled', 'stabilizer_window', 'stabilizer_threshold', 'stabilizer_max_leeway',
+        'stabilizer_step', 'stabilizer_change_threshold', 'base_leeway_db', 'current_leeway_db',
+        'volume_change_times', 'last_set_volume', 'stabilizer_adjust_interval', 'last_stabilizer_check',
+        # Threading and UI data
+        '_stop', '_thread', '_lock', 'ui_state',
+    )
+    
     def __init__(self, settings, audio_ctrl):
         self.settings = settings
         self.audio = audio_ctrl
@@ -371,6 +504,8 @@ class VolumeLimiter:
         self.last_over_threshold_time = 0
         self.time_over_threshold = 0.0  # How long audio has been over threshold
         self.peak_start_time = 0.0      # When peak started
+        self._silent_ticks = 0          # Consecutive quiet ticks (drives idle back-off)
+        self._ramp_volume = self.original_volume  # Volume the limiter last asked for (release ramp base)
         
         # Timing parameters (loaded from settings)
         self.attack_time = settings.attack_time    # How long peak must sustain before limiting
@@ -398,14 +533,16 @@ class VolumeLimiter:
         # Computed release rate (volume units per second)
         self._update_release_rate()
         
+        # Computed linear leeway factor (recomputed only when leeway_db changes)
+        self._update_leeway_factor()
+        
         # Threading
         self._stop = threading.Event()
         self._thread = None
         self._lock = threading.Lock()  # Protects shared state from GUI/hotkey threads
         
-        # UI data (updated atomically)
-        self.ui_peak = 0.0
-        self.ui_volume = self.original_volume
+        # UI data: (raw peak, system volume), replaced as one tuple so readers never see a mixed pair
+        self.ui_state = (0.0, self.original_volume)
     
     def _update_release_rate(self):
         """Calculate release rate from release time"""
@@ -414,7 +551,12 @@ class VolumeLimiter:
         else:
             self.release_rate = 10.0  # Very fast
     
-    def _track_volume_change(self, new_volume):
+    def _update_leeway_factor(self):
+        """Convert leeway from dB to a linear factor: 10^(dB/20)"""
+        # leeway_db of 3 means allow ~1.41x (√2) over threshold before full limiting
+        self.leeway_factor = 10 ** (self.leeway_db / 20)
+    
+    def _track_volume_change(self, new_volume, now):
         """Track significant volume changes for stabilizer"""
         if not self.stabilizer_enabled:
             return
@@ -423,7 +565,7 @@ class VolumeLimiter:
             # Check if change is significant (configurable threshold)
             change = abs(new_volume - self.last_set_volume)
             if change > self.stabilizer_change_threshold:
-                self.volume_change_times.append(time.time())
+                self.volume_change_times.append(now)
         
         self.last_set_volume = new_volume
     
@@ -447,6 +589,7 @@ class VolumeLimiter:
             if new_leeway != self.current_leeway_db:
                 self.current_leeway_db = new_leeway
                 self.leeway_db = new_leeway
+                self._update_leeway_factor()
         elif change_count < self.stabilizer_threshold // 2:
             # Few changes - gradually restore to base leeway
             if self.current_leeway_db > self.base_leeway_db:
@@ -454,6 +597,7 @@ class VolumeLimiter:
                 new_leeway = max(new_leeway, self.base_leeway_db)
                 self.current_leeway_db = new_leeway
                 self.leeway_db = new_leeway
+                self._update_leeway_factor()
     
     def start(self):
         self._thread = threading.Thread(target=self._run, daemon=True)
@@ -466,7 +610,7 @@ class VolumeLimiter:
     
     def _run(self):
         """Main limiter loop - runs at high frequency"""
-        last_time = time.time()
+        last_time = time.monotonic()
         
         while not self._stop.is_set():
             try:
@@ -475,12 +619,12 @@ class VolumeLimiter:
                     self.time_over_threshold = 0.0  # Reset when disabled
                     continue
                 
-                now = time.time()
+                now = time.monotonic()
                 dt = now - last_time
                 last_time = now
                 
                 # Check for user volume changes - let user freely adjust
-                if self.audio.check_user_changed():
+                if self.audio.check_user_changed(now):
                     new_user_vol = self.audio.user_set_volume
                     self.original_volume = new_user_vol
                     self.is_limiting = False
@@ -491,10 +635,16 @@ class VolumeLimiter:
                     time.sleep(0.02)
                     continue
                 
-                # Get current peak level
-                raw_peak = self.audio.get_raw_peak()
+                # Get current peak level (single meter read per tick)
+                _, vol, raw_peak = self.audio.snapshot()
                 self.current_peak = raw_peak
-                self.current_volume = self.audio.get_volume()
+                woke_from_idle = self._silent_ticks >= 50
+                if raw_peak < 0.005 and not self.is_limiting:
+                    self._silent_ticks += 1
+                else:
+                    self._silent_ticks = 0
+                # check_user_changed() just read the volume over COM; reuse that value
+                self.current_volume = vol
                 
                 # Calculate what the output would be at original volume
                 potential_output = raw_peak * self.original_volume
@@ -502,20 +652,15 @@ class VolumeLimiter:
                 # Read settings atomically (GUI/hotkeys can modify these)
                 with self._lock:
                     volume_cap = self.volume_cap
-                    leeway_db = self.leeway_db
+                    leeway_factor = self.leeway_factor
                     attack_time = self.attack_time
                     dampening = self.dampening
                     dampening_speed = self.dampening_speed
                 
-                # Calculate effective threshold with leeway
-                # leeway_db of 3 means allow ~1.41x (√2) over threshold before full limiting
-                # Convert dB to linear: 10^(dB/20)
-                leeway_factor = 10 ** (leeway_db / 20)
-                soft_threshold = volume_cap * leeway_factor  # Upper limit (hard cap)
-                
                 if potential_output > volume_cap and raw_peak > 0.001:
-                    # Audio is over threshold - accumulate time
-                    self.time_over_threshold += dt
+                    # Audio is over threshold - accumulate time. Coming out of the idle back-off the
+                    # ~100ms gap counts as one active tick, so it can't satisfy the attack time alone
+                    self.time_over_threshold += 0.02 if woke_from_idle else dt
                     self.last_over_threshold_time = now
                     
                     if self.time_over_threshold >= attack_time:
@@ -523,41 +668,13 @@ class VolumeLimiter:
                         if not self.is_limiting:
                             self.is_limiting = True
                         
-                        # Calculate how far into the leeway zone we are (0 to 1)
-                        # 0 = at volume_cap, 1 = at soft_threshold (max leeway)
-                        if potential_output >= soft_threshold:
-                            # Beyond leeway - full limiting
-                            leeway_ratio = 1.0
-                        else:
-                            # In leeway zone - partial limiting
-                            leeway_ratio = (potential_output - volume_cap) / (soft_threshold - volume_cap)
-                        
-                        # Reduction is proportional to how long over threshold
-                        # sustained_factor goes from 1.0 at attack_time to dampening over dampening_speed seconds
-                        time_since_attack = self.time_over_threshold - attack_time
-                        if dampening_speed > 0.001:
-                            # Ramp from 1.0 to dampening over dampening_speed seconds
-                            ramp_progress = min(1.0, time_since_attack / dampening_speed)
-                        else:
-                            # Instant dampening
-                            ramp_progress = 1.0
-                        sustained_factor = 1.0 + (dampening - 1.0) * ramp_progress
-                        sustained_factor = max(1.0, min(dampening, sustained_factor))
-                        
-                        # Target volume: softer reduction in leeway zone
-                        # At volume_cap: minimal reduction, at soft_threshold: full reduction
-                        # Prevent division by zero with minimum threshold
-                        safe_peak = max(raw_peak, 0.01)
-                        base_target = volume_cap / safe_peak
+                        target_volume = _limit_target(
+                            raw_peak, self.original_volume, volume_cap, leeway_factor,
+                            self.time_over_threshold, attack_time, dampening, dampening_speed,
+                        )
                         
-                        # Blend between original volume and base_target based on leeway_ratio
-                        target_volume = self.original_volume * (1 - leeway_ratio) + base_target * leeway_ratio
-                        
-                        # Apply sustained factor for longer peaks (divide = more reduction)
-                        target_volume = target_volume / sustained_factor
-                        target_volume = max(0.01, min(1.0, target_volume))
-                        
-                        self._track_volume_change(target_volume)
+                        self._ramp_volume = target_volume
+                        self._track_volume_change(target_volume, now)
                         self.audio.set_volume(target_volume)
                 else:
                     # Audio is under threshold
@@ -568,24 +685,26 @@ class VolumeLimiter:
                         
                         if time_since_loud > self.hold_time:
                             # RELEASE: Gradually return to original volume
-                            current = self.audio.get_volume()
+                            # Ramp from the requested level: small steps may not have been written yet
+                            current = self._ramp_volume
                             target = self.original_volume
                             
                             if current < target - 0.005:
                                 # Increase volume gradually
                                 new_vol = current + self.release_rate * dt
                                 new_vol = min(new_vol, target)
-                                self._track_volume_change(new_vol)
+                                self._ramp_volume = new_vol
+                                self._track_volume_change(new_vol, now)
                                 self.audio.set_volume(new_vol)
                             else:
                                 # Reached original volume, stop limiting
-                                self._track_volume_change(target)
-                                self.audio.set_volume(target)
+                                self._ramp_volume = target
+                                self._track_volume_change(target, now)
+                                self.audio.set_volume(target, force=True)
                                 self.is_limiting = False
                 
-                # Update UI data
-                self.ui_peak = self.audio.get_raw_peak()
-                self.ui_volume = self.audio.get_volume()
+                # Update UI data from this tick's reading (set_volume keeps the cache current)
+                self.ui_state = (raw_peak, self.audio._cached_volume)
                 
                 # Stabilizer: adjust leeway based on volume change frequency
                 if self.stabilizer_enabled:
@@ -594,8 +713,9 @@ class VolumeLimiter:
                 # Keep the thread alive; transient COM/tk errors shouldn't kill the loop.
                 time.sleep(0.05)
             
-            # Sleep for ~50Hz update rate
-            time.sleep(0.02)
+            # Sleep for ~50Hz update rate, backing off to 10Hz after ~1s of silence (so the first
+            # loud sample after a quiet spell is picked up up to 100ms late)
+            time.sleep(0.02 if self._silent_ticks < 50 else 0.1)
     
     def save_settings(self):
         with self._lock:
@@ -616,6 +736,65 @@ class VolumeLimiter:
         self.settings.save()
 
 
+# Slider value display per unit: (format string, conversion, whether the slider multiplier applies)
+SLIDER_FORMATS = {
+    "%": ("{:d}%", int, True),
+    "ms": ("{:d}ms", int, True),
+    "s": ("{:.1f}s", float, False),
+    "dB": ("{:.1f}dB", float, False),
+    "x": ("{:.1f}x", float, False),
+    "chg": ("{:d} chg", int, False),
+}
+
+
+def slider_formatter(unit, multiplier):
+    """Build the value -> label text function for a slider"""
+    fmt, conv, scaled = SLIDER_FORMATS[unit]
+    fmt = fmt.format
+    scale = multiplier if scaled else 1
+    return lambda v: fmt(conv(v * scale))
+
+
+# Plain NumPy on purpose: a JIT compile here would land on the Tk thread during the first draw
+def _simplify_polyline(xs, ys, keep, start, end, epsilon):
+    """Ramer-Douglas-Peucker: mark in keep the points of xs/ys[start:end] needed to stay within epsilon"""
+    stack = [(start, end - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        x0 = xs[first]
+        y0 = ys[first]
+        dx = xs[last] - x0
+        dy = ys[last] - y0
+        rel_x = xs[first + 1:last] - x0
+        rel_y = ys[first + 1:last] - y0
+        norm = float(dx * dx + dy * dy) ** 0.5
+        if norm > 0.0:
+            dist = np.abs(rel_x * dy - rel_y * dx) / norm
+        else:
+            dist = np.hypot(rel_x, rel_y)
+        i = int(np.argmax(dist))
+        if dist[i] > epsilon:
+            mid = first + 1 + i
+            keep[mid] = True
+            stack.append((first, mid))
+            stack.append((mid, last))
+
+
+class SliderRec:
+    """A slider's widgets, the limiter attribute it edits and its display formatter"""
+    
+    __slots__ = ('slider', 'var', 'label', 'formatter', 'param')
+    
+    def __init__(self, slider, var, label, formatter, param):
+        self.slider = slider
+        self.var = var
+        self.label = label
+        self.formatter = formatter
+        self.param = param
+
+
 class DolphinGUI:
     """Lightweight GUI"""
 
@@ -624,6 +803,7 @@ class DolphinGUI:
     VOLUME_CAP_HOTKEY_STEP = 0.01  # 1% per press
 
     MINI_MODE_SIZE = (520, 260)
+    GEOMETRY_PATTERN = re.compile(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)")  # As reported by wm geometry
     
     # Dark mode color scheme
     DARK_BG = '#1e1e1e'
@@ -649,26 +829,74 @@ class DolphinGUI:
         self.root.geometry("1200x850")
         self.root.resizable(False, False)
         
+        # Screen and window size cached for _position_window; the window size is seeded from the
+        # requested geometry (winfo_* reports 1x1 until the first layout pass) and tracked via <Configure>
+        self._sw = self.root.winfo_screenwidth()
+        self._sh = self.root.winfo_screenheight()
+        self._ww, self._wh = 1200, 850
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
+        # Whether the window is mapped; the graph isn't drawn while withdrawn to the tray or iconified
+        self._visible = False
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
+        
         # Initialize audio and limiter first (needed for dark_mode setting)
         self.settings = Settings()
         self.audio = AudioController()
         self.limiter = VolumeLimiter(self.settings, self.audio)
         
+        # Reuse the placement saved on the last exit, before any widget is laid out
+        self._restored_geometry = self._restore_geometry()
+        
         # Track dark mode state
         self.is_dark_mode = self.settings.dark_mode
         
-        # Store slider and toggle references for theme updates
-        self.all_sliders = []
+        # Slider records (theme updates, resets) and toggle references
+        self._sliders = []
         self.all_toggles = []
         
+        # Slider changes waiting to be applied to the limiter (see _queue_settings)
+        self._pending_settings = {}
+        self._flush_id = None
+        # Startup registry entry needs rewriting (see _schedule_registry_update)
+        self._registry_dirty = False
+        
         # Apply theme
         self._apply_theme()
         
-        # Audio history for graph
-        self.peak_history = [0.0] * 100
-        
-        # System tray
+        # Audio history for graph: fixed ring buffer, _peak_idx is the next write slot (oldest sample)
+        self.peak_history = np.zeros(100, dtype=np.float32)
+        self._peak_idx = 0
+        self._graph_ordered = np.empty_like(self.peak_history)  # Chronological copy used by _draw_graph
+        # Graph geometry and fill raster only depend on canvas size; rebuilt by _resize_graph
+        # from the canvas's <Configure> events (None until it has been laid out)
+        self._graph_size = None
+        self._graph_xs = None
+        self._graph_step = 0.0
+        self._graph_cols = None  # Pixel column centres
+        self._graph_rows = None  # Pixel row centres, shaped (h, 1) for broadcasting
+        self._graph_ppm_header = b''
+        self._graph_photo = None
+        self._graph_palette = None  # Graph background and fill RGB, indexed by the fill mask
+        # Latest fill raster job for the worker thread (see _graph_fill_worker); None stops it
+        self._graph_fill_jobs = queue.Queue(maxsize=1)
+        # Pooled waveform line items per kind, and how many of each are currently shown
+        self._graph_items = {'line': [], 'above': []}
+        self._graph_shown = {'line': 0, 'above': 0}
+        self._graph_style = None
+        
+        # Last values shown, so quiet UI ticks skip redundant Tk updates
+        self._last_peak_pct = None
+        self._last_vol_pct = None
+        self._last_leeway_shown = None
+        self._last_graph_key = None
+        self._last_drawn = np.zeros_like(self.peak_history)
+        
+        # System tray; a show/exit request from the tray thread that is still queued
+        # makes repeat clicks no-ops
         self.tray_icon = None
+        self._show_pending = False
+        self._exit_pending = False
         self._setup_tray()
         
         self._create_widgets()
@@ -682,20 +910,28 @@ class DolphinGUI:
         # Start limiter
         self.limiter.start()
         
-        # Position window
-        self._position_window()
+        # Position window (bottom-right corner unless the saved placement was restored)
+        if self._restored_geometry:
+            startup_geometry = self._restored_geometry
+        else:
+            startup_geometry = self._position_window()
         
         # Start minimized to tray if requested
         self._exiting = False
         if start_minimized and self.tray_icon:
             self.root.withdraw()
         
-        # Start UI updates (slower rate)
+        # Start UI updates (slower rate), with the graph fill rasterized on its own thread
+        threading.Thread(target=self._graph_fill_worker, daemon=True).start()
         self._schedule_ui_update()
 
-        # Apply persisted mini mode after widgets exist
-        self._normal_geometry = None
-        self._apply_mini_mode(bool(getattr(self.settings, 'mini_mode', False)), remember_geometry=True)
+        # Apply persisted mini mode after widgets exist; the window isn't laid out yet (Tk would
+        # report 0,0), so give it the full-size geometry to return to and the position to open at
+        self._normal_geometry = startup_geometry if self.settings.mini_mode else None
+        match = self.GEOMETRY_PATTERN.fullmatch(startup_geometry)
+        startup_position = (int(match.group(3)), int(match.group(4))) if match else None
+        self._apply_mini_mode(bool(getattr(self.settings, 'mini_mode', False)), remember_geometry=True,
+                              position=startup_position)
 
     def _toggle_mini_mode(self):
         enabled = bool(self.mini_mode_var.get())
@@ -703,7 +939,7 @@ class DolphinGUI:
         self.settings.save()
         self._apply_mini_mode(enabled, remember_geometry=True)
 
-    def _apply_mini_mode(self, enabled, remember_geometry):
+    def _apply_mini_mode(self, enabled, remember_geometry, position=None):
         if enabled:
             if remember_geometry and not self._normal_geometry:
                 # Keep full geometry including position
@@ -752,8 +988,8 @@ class DolphinGUI:
 
             w, h = self.MINI_MODE_SIZE
             try:
-                x = self.root.winfo_x()
-                y = self.root.winfo_y()
+                # Keep the window where it is, unless the caller knows a position Tk can't report yet
+                x, y = position if position is not None else (self.root.winfo_x(), self.root.winfo_y())
                 self.root.geometry(f"{w}x{h}+{x}+{y}")
             except Exception:
                 self.root.geometry(f"{w}x{h}")
@@ -855,16 +1091,15 @@ class DolphinGUI:
         self._hotkeys.start()
 
     def _adjust_volume_cap(self, delta):
+        self._flush_settings()
         with self.limiter._lock:
             new_cap = float(self.limiter.volume_cap) + float(delta)
             new_cap = max(self.VOLUME_CAP_MIN, min(self.VOLUME_CAP_MAX, new_cap))
             self.limiter.volume_cap = new_cap
 
-        if hasattr(self, 'slider_volume_cap'):
-            slider, var, label, unit, mult = self.slider_volume_cap
-            var.set(new_cap)
-            if unit == "%":
-                label.config(text=f"{int(new_cap * mult)}%")
+        if hasattr(self, '_cap_slider'):
+            self._cap_slider.var.set(new_cap)
+            self._cap_slider.label.config(text=self._cap_slider.formatter(new_cap))
 
         self._update_mini_threshold_label()
     
@@ -926,8 +1161,8 @@ class DolphinGUI:
             self.graph_canvas.configure(bg=self.theme_graph_bg)
         
         # Update all sliders with new theme colors
-        for slider in self.all_sliders:
-            slider.configure(
+        for rec in self._sliders:
+            rec.slider.configure(
                 bg=self.theme_bg, fg=self.theme_fg,
                 troughcolor=self.theme_trough, activebackground=self.theme_slider_fg
             )
@@ -939,7 +1174,7 @@ class DolphinGUI:
             toggle.fg_color = self.theme_fg
             toggle._draw()
         
-        self._draw_graph()
+        self._draw_graph(force=True)
     
     def _create_widgets(self):
         self.main_frame = ttk.Frame(self.root, padding="15")
@@ -960,8 +1195,8 @@ class DolphinGUI:
         # === Volume Cap Slider ===
         self.cap_frame = ttk.Frame(self.main_frame)
         self.cap_frame.pack(fill=tk.X, pady=0)
-        self._create_slider(self.cap_frame, "Volume Cap:", 0.05, 1.0, 0.01,
-                   self.limiter.volume_cap, self._on_cap_change, "%")
+        self._cap_slider = self._create_slider(self.cap_frame, "Volume Cap:", 0.05, 1.0, 0.01,
+                   'volume_cap', self._on_cap_change, "%")
         
         # === Side-by-side container for Advanced Settings and Stabilizer ===
         self.columns_frame = ttk.Frame(self.main_frame)
@@ -973,31 +1208,31 @@ class DolphinGUI:
         
         # Attack Time (1ms to 100ms)
         self._create_slider_compact(adv_frame, "Attack:", 0.001, 0.1, 0.001,
-                           self.limiter.attack_time, self._on_attack_change, "ms", 1000)
+                           'attack_time', self._on_attack_change, "ms", 1000)
         
         # Release Time (100ms to 3s)
         self._create_slider_compact(adv_frame, "Release:", 0.1, 3.0, 0.05,
-                           self.limiter.release_time, self._on_release_change, "ms", 1000)
+                           'release_time', self._on_release_change, "ms", 1000)
         
         # Hold Time (0 to 500ms)
         self._create_slider_compact(adv_frame, "Hold:", 0.0, 0.5, 0.01,
-                           self.limiter.hold_time, self._on_hold_change, "ms", 1000)
+                           'hold_time', self._on_hold_change, "ms", 1000)
         
         # User Cooldown (0.5s to 5s)
         self._create_slider_compact(adv_frame, "Cooldown:", 0.5, 5.0, 0.1,
-                           self.limiter.user_cooldown, self._on_cooldown_change, "s", 1)
+                           'user_cooldown', self._on_cooldown_change, "s", 1)
         
         # Leeway (0 to 12 dB)
         self._create_slider_compact(adv_frame, "Leeway:", 0.0, 12.0, 0.5,
-                           self.limiter.leeway_db, self._on_leeway_change, "dB", 1)
+                           'leeway_db', self._on_leeway_change, "dB", 1)
         
         # Dampening (1x to 5x)
         self._create_slider_compact(adv_frame, "Dampening:", 1.0, 5.0, 0.1,
-                           self.limiter.dampening, self._on_dampening_change, "x", 1)
+                           'dampening', self._on_dampening_change, "x", 1)
         
         # Dampening Speed (0 to 2 seconds)
         self._create_slider_compact(adv_frame, "Damp Spd:", 0.0, 2.0, 0.05,
-                           self.limiter.dampening_speed, self._on_dampening_speed_change, "s", 1)
+                           'dampening_speed', self._on_dampening_speed_change, "s", 1)
         
         # Right column: Stabilizer Settings
         stab_frame = ttk.LabelFrame(self.columns_frame, text="Stabilizer", padding="10", style='Big.TLabelframe')
@@ -1016,23 +1251,23 @@ class DolphinGUI:
         
         # Stabilizer window (1s to 30s)
         self._create_slider_compact(stab_frame, "Window:", 1.0, 30.0, 1.0,
-                           self.limiter.stabilizer_window, self._on_stab_window_change, "s", 1)
+                           'stabilizer_window', self._on_stab_window_change, "s", 1)
         
         # Stabilizer threshold (2 to 20 changes)
         self._create_slider_compact(stab_frame, "Count:", 2, 20, 1,
-                           self.limiter.stabilizer_threshold, self._on_stab_threshold_change, "chg", 1)
+                           'stabilizer_threshold', self._on_stab_threshold_change, "chg", 1)
         
         # Stabilizer change threshold (1% to 20%)
         self._create_slider_compact(stab_frame, "Change:", 0.01, 0.20, 0.01,
-                           self.limiter.stabilizer_change_threshold, self._on_stab_change_threshold, "%", 100)
+                           'stabilizer_change_threshold', self._on_stab_change_threshold, "%", 100)
         
         # Stabilizer max leeway (base to 20 dB)
         self._create_slider_compact(stab_frame, "Max:", 3.0, 20.0, 0.5,
-                           self.limiter.stabilizer_max_leeway, self._on_stab_max_leeway_change, "dB", 1)
+                           'stabilizer_max_leeway', self._on_stab_max_leeway_change, "dB", 1)
         
         # Stabilizer step (0.5 to 3 dB per adjustment)
         self._create_slider_compact(stab_frame, "Step:", 0.5, 3.0, 0.25,
-                           self.limiter.stabilizer_step, self._on_stab_step_change, "dB", 1)
+                           'stabilizer_step', self._on_stab_step_change, "dB", 1)
         
         # Current dynamic leeway display
         stab_status_frame = ttk.Frame(stab_frame)
@@ -1071,6 +1306,16 @@ class DolphinGUI:
         self.graph_canvas = tk.Canvas(self.graph_frame, width=1050, height=140, bg=self.theme_graph_bg, 
                                       highlightthickness=1, highlightbackground='#333')
         self.graph_canvas.pack(fill=tk.BOTH, expand=True)
+        self.graph_canvas.bind("<Configure>", self._on_graph_configure)
+        
+        # Area under the waveform, rasterized by _draw_graph into a PhotoImage below every other item
+        self._graph_fill_image = self.graph_canvas.create_image(0, 0, anchor=tk.NW)
+        
+        # Persistent threshold items, repositioned by _draw_graph instead of recreated each frame
+        self._graph_leeway_zone = self.graph_canvas.create_rectangle(0, 0, 0, 0, outline='', state=tk.HIDDEN)
+        self._graph_threshold_line = self.graph_canvas.create_line(0, 0, 0, 0, fill='#ff4444', width=2)
+        self._graph_leeway_line = self.graph_canvas.create_line(0, 0, 0, 0, fill='#ffa500', width=1,
+                                                                dash=(6, 3), state=tk.HIDDEN)
         
         # Bottom buttons and toggles frame
         self.bottom_frame = ttk.Frame(self.main_frame)
@@ -1127,159 +1372,118 @@ class DolphinGUI:
         self.mini_mode_toggle.pack(side=tk.LEFT, padx=0)
         self.all_toggles.append(self.mini_mode_toggle)
     
-    def _create_slider_compact(self, parent, label_text, from_, to, resolution, initial, callback, unit, multiplier=100):
-        """Create a compact labeled slider with value display"""
+    def _create_slider_compact(self, parent, label_text, from_, to, resolution, param, callback, unit, multiplier=100):
+        """Create a compact labeled slider bound to a limiter parameter"""
         frame = ttk.Frame(parent)
         frame.pack(fill=tk.X, pady=3)
         
         ttk.Label(frame, text=label_text, width=9, font=('Arial', 15)).pack(side=tk.LEFT)
         
-        # Format value based on unit
-        val_text = self._format_value(initial, unit, multiplier)
-        
-        val_label = ttk.Label(frame, text=val_text, width=7, font=('Arial', 15))
-        val_label.pack(side=tk.RIGHT)
-        
-        var = tk.DoubleVar(value=initial)
-        slider = tk.Scale(
-            frame, from_=from_, to=to,
-            variable=var, orient=tk.HORIZONTAL,
-            resolution=resolution, showvalue=False, length=170,
-            sliderlength=30, width=22,
-            bg=self.theme_bg, fg=self.theme_fg,
-            troughcolor=self.theme_trough, activebackground=self.theme_slider_fg,
-            highlightthickness=0,
-            command=lambda v, cb=callback, lbl=val_label, u=unit, m=multiplier: 
-                self._slider_callback(v, cb, lbl, u, m)
-        )
-        slider.pack(side=tk.RIGHT, padx=3)
-        
-        # Store reference for theme updates
-        self.all_sliders.append(slider)
-        
-        # Store reference for resetting
-        setattr(self, f"slider_{label_text.replace(':', '').replace(' ', '_').lower()}", 
-                (slider, var, val_label, unit, multiplier))
-        
-        return val_label
-    
-    def _format_value(self, v, unit, multiplier):
-        """Format a value based on unit type"""
-        if unit == "%":
-            return f"{int(v * multiplier)}%"
-        elif unit == "ms":
-            return f"{int(v * multiplier)}ms"
-        elif unit == "dB":
-            return f"{v:.1f}dB"
-        elif unit == "x":
-            return f"{v:.1f}x"
-        elif unit == "chg":
-            return f"{int(v)}"
-        else:
-            return f"{v:.1f}s"
+        return self._add_slider(frame, from_, to, resolution, param, callback, unit, multiplier,
+                                label_width=7, font_size=15, length=170, sliderlength=30, width=22, padx=3)
     
-    def _create_slider(self, parent, label_text, from_, to, resolution, initial, callback, unit, multiplier=100):
-        """Create a labeled slider with value display"""
+    def _create_slider(self, parent, label_text, from_, to, resolution, param, callback, unit, multiplier=100):
+        """Create a labeled slider bound to a limiter parameter"""
         frame = ttk.Frame(parent)
         frame.pack(fill=tk.X, pady=6)
         
         ttk.Label(frame, text=label_text, width=12, font=('Arial', 16)).pack(side=tk.LEFT)
         
-        # Format value based on unit
-        if unit == "%":
-            val_text = f"{int(initial * multiplier)}%"
-        elif unit == "ms":
-            val_text = f"{int(initial * multiplier)}ms"
-        elif unit == "dB":
-            val_text = f"{initial:.1f}dB"
-        elif unit == "x":
-            val_text = f"{initial:.1f}x"
-        elif unit == "chg":
-            val_text = f"{int(initial)} chg"
-        else:
-            val_text = f"{initial:.1f}s"
+        return self._add_slider(frame, from_, to, resolution, param, callback, unit, multiplier,
+                                label_width=8, font_size=16, length=320, sliderlength=36, width=26, padx=8)
+    
+    def _add_slider(self, frame, from_, to, resolution, param, callback, unit, multiplier,
+                    label_width, font_size, length, sliderlength, width, padx):
+        """Build the value label + Scale pair and register its SliderRec"""
+        initial = getattr(self.limiter, param)
+        formatter = slider_formatter(unit, multiplier)
         
-        val_label = ttk.Label(frame, text=val_text, width=8, font=('Arial', 16))
+        val_label = ttk.Label(frame, text=formatter(initial), width=label_width, font=('Arial', font_size))
         val_label.pack(side=tk.RIGHT)
         
         var = tk.DoubleVar(value=initial)
+        rec = SliderRec(None, var, val_label, formatter, param)
         slider = tk.Scale(
             frame, from_=from_, to=to,
             variable=var, orient=tk.HORIZONTAL,
-            resolution=resolution, showvalue=False, length=320,
-            sliderlength=36, width=26,
+            resolution=resolution, showvalue=False, length=length,
+            sliderlength=sliderlength, width=width,
             bg=self.theme_bg, fg=self.theme_fg,
             troughcolor=self.theme_trough, activebackground=self.theme_slider_fg,
             highlightthickness=0,
-            command=lambda v, cb=callback, lbl=val_label, u=unit, m=multiplier: 
-                self._slider_callback(v, cb, lbl, u, m)
+            command=lambda v, cb=callback, r=rec: self._slider_callback(v, cb, r)
         )
-        slider.pack(side=tk.RIGHT, padx=8)
-        
-        # Store reference for theme updates
-        self.all_sliders.append(slider)
+        slider.pack(side=tk.RIGHT, padx=padx)
+        rec.slider = slider
         
-        # Store reference for resetting
-        setattr(self, f"slider_{label_text.replace(':', '').replace(' ', '_').lower()}", 
-                (slider, var, val_label, unit, multiplier))
-        
-        return val_label
+        # Store reference for theme updates and resetting
+        self._sliders.append(rec)
+        return rec
     
-    def _slider_callback(self, val, callback, label, unit, multiplier):
+    def _slider_callback(self, val, callback, rec):
         """Generic slider callback"""
         v = float(val)
         callback(v)
-        if unit == "%":
-            label.config(text=f"{int(v * multiplier)}%")
-        elif unit == "ms":
-            label.config(text=f"{int(v * multiplier)}ms")
-        elif unit == "dB":
-            label.config(text=f"{v:.1f}dB")
-        elif unit == "x":
-            label.config(text=f"{v:.1f}x")
-        elif unit == "chg":
-            label.config(text=f"{int(v)} chg")
-        else:
-            label.config(text=f"{v:.1f}s")
+        rec.label.config(text=rec.formatter(v))
     
-    def _on_cap_change(self, val):
+    def _queue_settings(self, **values):
+        """Coalesce limiter parameter changes from slider drags into one locked update"""
+        self._pending_settings.update(values)
+        if self._flush_id is None:
+            self._flush_id = self.root.after(30, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Apply all pending slider values to the limiter at once"""
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._pending_settings:
+            return
+        
+        pending = self._pending_settings
+        self._pending_settings = {}
         with self.limiter._lock:
-            self.limiter.volume_cap = float(val)
-
-        self._update_mini_threshold_label()
+            for name, value in pending.items():
+                setattr(self.limiter, name, value)
+            # Recompute derived values once per batch
+            if 'release_time' in pending:
+                self.limiter._update_release_rate()
+            if 'leeway_db' in pending:
+                self.limiter._update_leeway_factor()
+        
+        if 'volume_cap' in pending:
+            self._update_mini_threshold_label()
+    
+    def _on_cap_change(self, val):
+        self._queue_settings(volume_cap=float(val))
     
     def _on_attack_change(self, val):
-        with self.limiter._lock:
-            self.limiter.attack_time = float(val)
+        self._queue_settings(attack_time=float(val))
     
     def _on_release_change(self, val):
-        with self.limiter._lock:
-            self.limiter.release_time = float(val)
-            self.limiter._update_release_rate()
+        self._queue_settings(release_time=float(val))
     
     def _on_hold_change(self, val):
-        with self.limiter._lock:
-            self.limiter.hold_time = float(val)
+        self._queue_settings(hold_time=float(val))
     
     def _on_cooldown_change(self, val):
-        with self.limiter._lock:
-            self.limiter.user_cooldown = float(val)
+        self._queue_settings(user_cooldown=float(val))
     
     def _on_leeway_change(self, val):
-        with self.limiter._lock:
-            self.limiter.leeway_db = float(val)
-            self.limiter.base_leeway_db = float(val)  # Update base for stabilizer
-            self.limiter.current_leeway_db = float(val)  # Reset current
+        self._queue_settings(
+            leeway_db=float(val),
+            base_leeway_db=float(val),  # Update base for stabilizer
+            current_leeway_db=float(val),  # Reset current
+        )
     
     def _on_dampening_change(self, val):
-        with self.limiter._lock:
-            self.limiter.dampening = float(val)
+        self._queue_settings(dampening=float(val))
     
     def _on_dampening_speed_change(self, val):
-        with self.limiter._lock:
-            self.limiter.dampening_speed = float(val)
+        self._queue_settings(dampening_speed=float(val))
     
     def _on_stabilizer_change(self):
+        self._flush_settings()
         with self.limiter._lock:
             enabled = self.stabilizer_var.get()
             self.limiter.stabilizer_enabled = enabled
@@ -1287,58 +1491,32 @@ class DolphinGUI:
             if not enabled:
                 self.limiter.current_leeway_db = self.limiter.base_leeway_db
                 self.limiter.leeway_db = self.limiter.base_leeway_db
+                self.limiter._update_leeway_factor()
                 self.limiter.volume_change_times.clear()
     
     def _on_stab_window_change(self, val):
-        with self.limiter._lock:
-            self.limiter.stabilizer_window = float(val)
+        self._queue_settings(stabilizer_window=float(val))
     
     def _on_stab_threshold_change(self, val):
-        with self.limiter._lock:
-            self.limiter.stabilizer_threshold = int(float(val))
+        self._queue_settings(stabilizer_threshold=int(float(val)))
     
     def _on_stab_max_leeway_change(self, val):
-        with self.limiter._lock:
-            self.limiter.stabilizer_max_leeway = float(val)
+        self._queue_settings(stabilizer_max_leeway=float(val))
     
     def _on_stab_step_change(self, val):
-        with self.limiter._lock:
-            self.limiter.stabilizer_step = float(val)
+        self._queue_settings(stabilizer_step=float(val))
     
     def _on_stab_change_threshold(self, val):
-        with self.limiter._lock:
-            self.limiter.stabilizer_change_threshold = float(val)
+        self._queue_settings(stabilizer_change_threshold=float(val))
     
     def _update_slider_displays(self):
         """Update all slider positions and labels to match current limiter values"""
-        sliders = [
-            ('slider_volume_cap', self.limiter.volume_cap),
-            ('slider_attack', self.limiter.attack_time),
-            ('slider_release', self.limiter.release_time),
-            ('slider_hold', self.limiter.hold_time),
-            ('slider_cooldown', self.limiter.user_cooldown),
-            ('slider_leeway', self.limiter.leeway_db),
-            ('slider_dampening', self.limiter.dampening),
-            ('slider_damp_speed', self.limiter.dampening_speed),
-        ]
-        for attr, value in sliders:
-            if hasattr(self, attr):
-                slider, var, label, unit, mult = getattr(self, attr)
-                var.set(value)
-                if unit == "%":
-                    label.config(text=f"{int(value * mult)}%")
-                elif unit == "ms":
-                    label.config(text=f"{int(value * mult)}ms")
-                elif unit == "dB":
-                    label.config(text=f"{value:.1f}dB")
-                elif unit == "x":
-                    label.config(text=f"{value:.1f}x")
-                elif unit == "chg":
-                    label.config(text=f"{int(value)} chg")
-                else:
-                    label.config(text=f"{value:.1f}s")
+        for rec in self._sliders:
+            value = getattr(self.limiter, rec.param)
+            rec.var.set(value)
+            rec.label.config(text=rec.formatter(value))
 
-            self._update_mini_threshold_label()
+        self._update_mini_threshold_label()
 
     def _update_mini_threshold_label(self):
         if hasattr(self, 'mini_mode_threshold_label'):
@@ -1347,6 +1525,7 @@ class DolphinGUI:
     
     def _reset_defaults(self):
         """Reset advanced settings to defaults (preserves volume cap)"""
+        self._flush_settings()
         with self.limiter._lock:
             self.limiter.attack_time = 0.05  # 50ms
             self.limiter.release_time = 0.5
@@ -1358,6 +1537,7 @@ class DolphinGUI:
             self.limiter.dampening = 1.0     # 1x (no dampening by default)
             self.limiter.dampening_speed = 0.0  # 0s (instant) by default
             self.limiter._update_release_rate()
+            self.limiter._update_leeway_factor()
         
         # Reset stabilizer
         self.limiter.stabilizer_enabled = False
@@ -1386,10 +1566,25 @@ class DolphinGUI:
     def _on_startup_change(self):
         enabled = self.startup_var.get()
         self.settings.run_at_startup = enabled
+        self._schedule_registry_update()
+    
+    def _schedule_registry_update(self):
+        """Coalesce startup registry writes from rapid toggling into one update"""
+        if not self._registry_dirty:
+            self._registry_dirty = True
+            self.root.after(200, self._flush_registry)
+    
+    def _flush_registry(self):
+        """Write the final startup state to the registry if it changed"""
+        if not self._registry_dirty:
+            return
+        self._registry_dirty = False
         self._update_startup_registry()
     
     def _update_startup_registry(self):
         """Update Windows startup registry with correct flags"""
+        import winreg  # Only needed when the startup toggles change
+        
         key_path = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
         try:
             key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path, 0, winreg.KEY_SET_VALUE)
@@ -1419,7 +1614,7 @@ class DolphinGUI:
         self.settings.save()
         # Update registry if startup is enabled (to add/remove --minimized flag)
         if self.settings.run_at_startup:
-            self._update_startup_registry()
+            self._schedule_registry_update()
     
     def _schedule_ui_update(self):
         """Update UI at 10Hz - much less CPU intensive"""
@@ -1427,34 +1622,38 @@ class DolphinGUI:
             return
 
         try:
-            peak = self.limiter.ui_peak  # Raw audio level (0-1)
-            vol = self.limiter.ui_volume
+            peak, vol = self.limiter.ui_state  # Raw audio level (0-1), system volume
 
             # Show raw peak as percentage (this is the audio level relative to system volume)
+            # Labels are only reconfigured when the shown value changes
             peak_pct = int(peak * 100)
             vol_pct = int(vol * 100)
-            self.peak_label.config(text=f"{peak_pct}%")
-            self.vol_label.config(text=f"{vol_pct}%")
-
-            if hasattr(self, 'mini_audio_label'):
+            if peak_pct != self._last_peak_pct:
+                self._last_peak_pct = peak_pct
+                self.peak_label.config(text=f"{peak_pct}%")
                 self.mini_audio_label.config(text=f"A: {peak_pct}%")
-            if hasattr(self, 'mini_system_label'):
+            if vol_pct != self._last_vol_pct:
+                self._last_vol_pct = vol_pct
+                self.vol_label.config(text=f"{vol_pct}%")
                 self.mini_system_label.config(text=f"S: {vol_pct}%")
 
             # Update dynamic leeway display for stabilizer
             current_leeway = self.limiter.current_leeway_db
             base_leeway = self.limiter.base_leeway_db
-            if current_leeway > base_leeway:
-                self.dynamic_leeway_label.config(
-                    text=f"{current_leeway:.1f}dB (+{current_leeway - base_leeway:.1f})",
-                    foreground="#ffa500",
-                )
-            else:
-                self.dynamic_leeway_label.config(text=f"{current_leeway:.1f}dB", foreground="#4a9eff")
+            # Text and colour depend on both values (the user can move the base onto the current)
+            if (current_leeway, base_leeway) != self._last_leeway_shown:
+                self._last_leeway_shown = (current_leeway, base_leeway)
+                if current_leeway > base_leeway:
+                    self.dynamic_leeway_label.config(
+                        text=f"{current_leeway:.1f}dB (+{current_leeway - base_leeway:.1f})",
+                        foreground="#ffa500",
+                    )
+                else:
+                    self.dynamic_leeway_label.config(text=f"{current_leeway:.1f}dB", foreground="#4a9eff")
 
             # Update graph with raw peak level
-            self.peak_history.pop(0)
-            self.peak_history.append(peak)
+            self.peak_history[self._peak_idx] = peak
+            self._peak_idx = (self._peak_idx + 1) % len(self.peak_history)
             self._draw_graph()
         except tk.TclError:
             # Window is likely shutting down.
@@ -1463,19 +1662,34 @@ class DolphinGUI:
             self._update_mini_threshold_label()
         self.root.after(100, self._schedule_ui_update)
     
-    def _draw_graph(self):
+    def _draw_graph(self, force=False):
         """Draw the audio level graph with threshold and dynamic leeway indicators"""
+        if not self._visible or self._graph_size is None:
+            return
         canvas = self.graph_canvas
-        canvas.delete("all")
-        
-        # Get actual canvas size
-        w = canvas.winfo_width()
-        h = canvas.winfo_height()
-        if w < 10 or h < 10:  # Canvas not yet realized
-            w = 650
-            h = 100
-        
-        num_points = len(self.peak_history)
+        w, h = self._graph_size
+        
+        # Unroll the ring buffer into chronological order (oldest first) without allocating
+        idx = self._peak_idx
+        history = self._graph_ordered
+        num_points = len(history)
+        history[:num_points - idx] = self.peak_history[idx:]
+        history[num_points - idx:] = self.peak_history[:idx]
+        
+        # Skip (unless forced) when no sample would move by a pixel and the threshold is unchanged
+        graph_key = (
+            w, h,
+            self.limiter.volume_cap,
+            self.limiter.original_volume,
+            self.limiter.current_leeway_db,
+            self.limiter.base_leeway_db,  # The leeway zone shows only while current exceeds base
+            self.limiter.stabilizer_enabled,
+        )
+        if (not force and graph_key == self._last_graph_key
+                and np.max(np.abs(history - self._last_drawn)) * h < 1.0):
+            return
+        self._last_graph_key = graph_key
+        self._last_drawn[:] = history
         
         # Calculate threshold as peak level
         # Limiting starts when peak * original_volume > volume_cap
@@ -1484,123 +1698,268 @@ class DolphinGUI:
         threshold = min(1.0, self.limiter.volume_cap / original_vol)
         threshold_y = h - (threshold * h)
         
-        # Calculate dynamic leeway threshold (stabilizer)
-        # Current leeway in dB -> linear factor: 10^(dB/20)
-        leeway_factor = 10 ** (self.limiter.current_leeway_db / 20)
-        dynamic_threshold = min(1.0, threshold * leeway_factor)
+        # Calculate dynamic leeway threshold (stabilizer), using the limiter's cached linear factor
+        dynamic_threshold = min(1.0, threshold * self.limiter.leeway_factor)
         dynamic_threshold_y = h - (dynamic_threshold * h)
         
-        # Draw dynamic leeway zone (shaded area between threshold and dynamic threshold)
+        # Dynamic leeway zone (shaded area between threshold and dynamic threshold)
         if self.limiter.stabilizer_enabled and self.limiter.current_leeway_db > self.limiter.base_leeway_db:
-            canvas.create_rectangle(0, dynamic_threshold_y, w, threshold_y, 
-                                   fill='#4a3000' if self.is_dark_mode else '#ffe4b3', outline='')
+            canvas.coords(self._graph_leeway_zone, 0, dynamic_threshold_y, w, threshold_y)
+            canvas.itemconfigure(self._graph_leeway_zone, state=tk.NORMAL,
+                                 fill='#4a3000' if self.is_dark_mode else '#ffe4b3')
+        else:
+            canvas.itemconfigure(self._graph_leeway_zone, state=tk.HIDDEN)
         
-        # Draw threshold line (red, solid)
-        canvas.create_line(0, threshold_y, w, threshold_y, fill='#ff4444', width=2)
+        # Threshold line (red, solid)
+        canvas.coords(self._graph_threshold_line, 0, threshold_y, w, threshold_y)
         
-        # Draw dynamic leeway line (orange, dashed) if stabilizer is active
+        # Dynamic leeway line (orange, dashed) if stabilizer is active
         if self.limiter.stabilizer_enabled:
-            canvas.create_line(0, dynamic_threshold_y, w, dynamic_threshold_y, 
-                              fill='#ffa500', width=1, dash=(6, 3))
+            canvas.coords(self._graph_leeway_line, 0, dynamic_threshold_y, w, dynamic_threshold_y)
+            canvas.itemconfigure(self._graph_leeway_line, state=tk.NORMAL)
+        else:
+            canvas.itemconfigure(self._graph_leeway_line, state=tk.HIDDEN)
         
         # Draw waveform
         if num_points < 2:
             return
         
-        step = w / (num_points - 1)
+        xs = self._graph_xs
+        step = self._graph_step
+        ys = h - history * h
+        above = history > threshold
+        
+        # Segment boundaries: index of the first sample after each threshold crossing,
+        # with the crossing point linearly interpolated between the two samples
+        bounds = np.flatnonzero(above[1:] != above[:-1]) + 1
+        prev = history[bounds - 1]
+        t = (threshold - prev) / (history[bounds] - prev)
+        cross_xs = (bounds - 1 + t) * step
+        
+        # One dense polyline with every crossing inserted twice (it ends one segment and starts
+        # the next); after simplification it is interleaved as x0, y0, x1, y1, ... and converted
+        # to Python floats once
+        at = np.repeat(bounds, 2)
+        dense_xs = np.insert(xs, at, np.repeat(cross_xs, 2))
+        dense_ys = np.insert(ys, at, threshold_y)
+        
+        # Segment k runs from the second copy of crossing k-1 through the first copy of crossing k
+        seg_bounds = bounds + 2 * np.arange(len(bounds))
+        seg_starts = np.concatenate(([0], seg_bounds + 1))
+        seg_ends = np.concatenate((seg_bounds + 1, [len(dense_xs)]))
+        seg_above = above[np.concatenate(([0], bounds))]
+        
+        # Drop points within half a pixel of the simplified line; segment ends are always kept
+        keep = np.zeros(len(dense_xs), dtype=bool)
+        keep[seg_starts] = True
+        keep[seg_ends - 1] = True
+        for start, end in zip(seg_starts.tolist(), seg_ends.tolist()):
+            _simplify_polyline(dense_xs, dense_ys, keep, start, end, 0.5)
+        kept_before = np.concatenate(([0], np.cumsum(keep)))
+        seg_starts = kept_before[seg_starts] * 2
+        seg_ends = kept_before[seg_ends] * 2
+        
+        pts = np.empty(2 * int(kept_before[-1]), dtype=np.float32)
+        pts[0::2] = dense_xs[keep]
+        pts[1::2] = dense_ys[keep]
+        # One bulk conversion: tkinter only turns lists/tuples into Tcl lists (a typed buffer
+        # such as array.array would reach Tcl as its repr), so the coords must be Python floats
+        pts = pts.tolist()
         
-        # Collect points for below and above threshold
         below_segments = []
         above_segments = []
-        current_segment = []
-        last_above = None
+        for start, end, is_above in zip(seg_starts.tolist(), seg_ends.tolist(), seg_above.tolist()):
+            (above_segments if is_above else below_segments).append(pts[start:end])
         
-        for i, peak in enumerate(self.peak_history):
-            x = i * step
-            y = h - (peak * h)
-            is_above = peak > threshold
+        # Restyle pooled waveform items and the fill palette only when the theme changed
+        if self.is_dark_mode:
+            style = ('#2d5a2d', '#44ff44', '#ff6b6b')  # fill, line, above-threshold line
+        else:
+            style = ('#c8e6c9', '#2e7d32', '#d32f2f')
+        if style != self._graph_style:
+            self._graph_style = style
+            for kind, color in zip(('line', 'above'), style[1:]):
+                for item in self._graph_items[kind]:
+                    canvas.itemconfigure(item, fill=color)
+            self._graph_palette = np.array(
+                [list(bytes.fromhex(color[1:])) for color in (self.theme_graph_bg, style[0])],
+                dtype=np.uint8)
+        
+        # Filled area under below-threshold segments, rasterized off the Tk thread. The job names
+        # the canvas size rather than carrying the PhotoImage, so no Tk object (whose __del__ runs
+        # a Tcl command) is ever held by the worker
+        self._submit_graph_fill((self._graph_size, history.copy(), xs, self._graph_cols,
+                                 self._graph_rows, threshold, self._graph_palette,
+                                 self._graph_ppm_header))
+        
+        # Solid line over the below-threshold segments, above-threshold segments as dashed lines
+        created = self._sync_graph_items('line', below_segments)
+        created |= self._sync_graph_items('above', above_segments)
+        if created:
+            # New items land on top; keep solid lines < dashed lines
+            canvas.tag_raise('wave_above')
+    
+    def _on_graph_configure(self, event):
+        if event.width >= 10 and event.height >= 10 and (event.width, event.height) != self._graph_size:
+            self._resize_graph(event.width, event.height)
+    
+    def _resize_graph(self, w, h):
+        """Rebuild the graph's x coordinates, pixel grid and fill image for a w x h canvas"""
+        num_points = len(self.peak_history)
+        self._graph_size = (w, h)
+        self._graph_xs = np.linspace(0, w, num_points, dtype=np.float32)
+        self._graph_step = w / (num_points - 1)
+        self._graph_cols = np.arange(w, dtype=np.float32) + 0.5
+        self._graph_rows = (np.arange(h, dtype=np.float32) + 0.5)[:, None]
+        self._graph_ppm_header = b'P6 %d %d 255\n' % (w, h)
+        self._graph_photo = tk.PhotoImage(master=self.graph_canvas, width=w, height=h)
+        self.graph_canvas.itemconfigure(self._graph_fill_image, image=self._graph_photo)
+    
+    def _submit_graph_fill(self, job):
+        """Queue a fill raster job, replacing one the worker hasn't picked up yet"""
+        # Only the Tk thread puts, so the queue is empty again once a stale job is dropped
+        try:
+            self._graph_fill_jobs.get_nowait()
+        except queue.Empty:
+            pass
+        self._graph_fill_jobs.put_nowait(job)
+    
+    def _graph_fill_worker(self):
+        """Rasterize queued fill jobs into PPM data and hand it to the Tk thread"""
+        frame_header = None
+        while True:
+            job = self._graph_fill_jobs.get()
+            if job is None:
+                return
+            size, history, xs, cols, rows, threshold, palette, header = job
+            h = len(rows)
+            if header != frame_header:
+                # One PPM buffer per canvas size: the header is written once and the raster is a
+                # view of the pixel part, so frames are rendered in place with no concatenation
+                frame_header = header
+                frame = bytearray(header) + bytearray(h * len(cols) * 3)
+                raster = np.frombuffer(frame, dtype=np.uint8, offset=len(header)).reshape(h, len(cols), 3)
             
-            if last_above is None:
-                last_above = is_above
-                current_segment = [(x, y)]
-            elif is_above == last_above:
-                current_segment.append((x, y))
-            else:
-                # Transition point - interpolate crossing
-                prev_peak = self.peak_history[i - 1]
-                if threshold != prev_peak and peak != prev_peak:
-                    t = (threshold - prev_peak) / (peak - prev_peak)
-                    cross_x = (i - 1 + t) * step
-                    cross_y = h - (threshold * h)
-                    current_segment.append((cross_x, cross_y))
-                
-                if last_above:
-                    above_segments.append(current_segment)
-                else:
-                    below_segments.append(current_segment)
-                
-                current_segment = [(cross_x, cross_y) if threshold != prev_peak and peak != prev_peak else (x, y), (x, y)]
-                last_above = is_above
-        
-        # Add final segment
-        if current_segment:
-            if last_above:
-                above_segments.append(current_segment)
+            # A pixel is filled when the curve at its column is not above the threshold (tested
+            # on levels, like the segment split) and the pixel lies under the curve
+            curve = np.interp(cols, xs, history)
+            curve_ys = h - curve * h
+            curve_ys[curve > threshold] = h
+            fill_mask = (rows >= curve_ys).view(np.uint8)
+            np.take(palette, fill_mask, axis=0, out=raster)
+            try:
+                # Tk needs bytes (a bytearray would be sent as its repr); the snapshot also
+                # frees the buffer for the next frame
+                self.root.after_idle(self._put_graph_fill, size, bytes(frame))
+            except (RuntimeError, tk.TclError):
+                # Tk isn't running its main loop (yet, or any more)
+                if self._exiting:
+                    return
+    
+    def _put_graph_fill(self, size, data):
+        # Drop rasters rendered for a canvas size that has since changed
+        if size == self._graph_size:
+            self._graph_photo.put(data)
+    
+    def _sync_graph_items(self, kind, segments):
+        """Move pooled waveform items of one kind onto segments, hiding leftovers; True if any were created"""
+        canvas = self.graph_canvas
+        items = self._graph_items[kind]
+        shown = self._graph_shown[kind]
+        count = len(segments)
+        for item in items[shown:count]:
+            canvas.itemconfigure(item, state=tk.NORMAL)
+        for item in items[count:shown]:
+            canvas.itemconfigure(item, state=tk.HIDDEN)
+        self._graph_shown[kind] = count
+        
+        created = False
+        for i, points in enumerate(segments):
+            if i < len(items):
+                canvas.coords(items[i], points)  # One Tcl list argument, no per-vertex unpacking
             else:
-                below_segments.append(current_segment)
-        
-        # Draw filled area under below-threshold segments
-        fill_color = '#2d5a2d' if self.is_dark_mode else '#c8e6c9'
-        line_color = '#44ff44' if self.is_dark_mode else '#2e7d32'
-        above_line_color = '#ff6b6b' if self.is_dark_mode else '#d32f2f'
-        
-        for segment in below_segments:
-            if len(segment) >= 2:
-                points = []
-                for x, y in segment:
-                    points.extend([x, y])
-                # Fill area
-                fill_pts = [segment[0][0], h] + points + [segment[-1][0], h]
-                canvas.create_polygon(fill_pts, fill=fill_color, outline='')
-                # Draw solid line
-                canvas.create_line(points, fill=line_color, width=2, smooth=True)
-        
-        # Draw above-threshold segments as dashed lines (no fill)
-        for segment in above_segments:
-            if len(segment) >= 2:
-                points = []
-                for x, y in segment:
-                    points.extend([x, y])
-                # Draw dashed line for above threshold
-                canvas.create_line(points, fill=above_line_color, width=2, dash=(4, 4))
+                items.append(self._create_graph_item(kind, points))
+                created = True
+        return created
+    
+    def _create_graph_item(self, kind, points):
+        canvas = self.graph_canvas
+        _, line_color, above_line_color = self._graph_style
+        if kind == 'line':
+            return canvas.create_line(points, fill=line_color, width=2, tags='wave_line')
+        return canvas.create_line(points, fill=above_line_color, width=2, dash=(4, 4),
+                                  tags='wave_above')
+    
+    def _on_root_configure(self, event):
+        # The toplevel's binding also sees <Configure> from every child widget
+        if event.widget is self.root:
+            self._ww, self._wh = event.width, event.height
+    
+    def _on_root_map(self, event):
+        if event.widget is self.root:
+            self._visible = True
+    
+    def _on_root_unmap(self, event):
+        if event.widget is self.root:
+            self._visible = False
     
     def _position_window(self):
-        self.root.update_idletasks()
-        sw = self.root.winfo_screenwidth()
-        sh = self.root.winfo_screenheight()
-        ww = self.root.winfo_width()
-        wh = self.root.winfo_height()
-        self.root.geometry(f"+{sw - ww - 20}+{sh - wh - 80}")
+        geometry = f"{self._ww}x{self._wh}+{self._sw - self._ww - 20}+{self._sh - self._wh - 80}"
+        self.root.geometry(geometry)
+        return geometry
+    
+    def _restore_geometry(self):
+        """Apply the saved window geometry, kept on screen; returns it, or None if missing or malformed"""
+        geometry = self.settings.window_geometry
+        match = self.GEOMETRY_PATTERN.fullmatch(geometry) if isinstance(geometry, str) else None
+        if not match:
+            return None
+        w, h, x, y = (int(group) for group in match.groups())
+        # The screen may have shrunk or lost a monitor since the last exit; the window is fixed-size,
+        # so pull it back inside the (startup-cached) screen area
+        x = max(0, min(x, self._sw - w))
+        y = max(0, min(y, self._sh - h))
+        geometry = f"{w}x{h}+{x}+{y}"
+        try:
+            self.root.geometry(geometry)
+        except tk.TclError:
+            return None
+        self._ww, self._wh = w, h
+        return geometry
+    
+    def _remember_geometry(self):
+        """Store the full-size window geometry in settings (saved with them on exit)"""
+        geometry = self._normal_geometry if self.settings.mini_mode else self.root.geometry()
+        match = self.GEOMETRY_PATTERN.fullmatch(geometry or "")
+        # A window that was never laid out (started minimized) reports 1x1; keep the old value then
+        if match and int(match.group(1)) > 1:
+            self.settings.window_geometry = geometry
+    
+    def _maybe_import_tray(self):
+        """Import the optional tray dependencies (pystray + Pillow), or None if missing"""
+        try:
+            import pystray
+            from PIL import Image
+        except ImportError:
+            return None
+        return pystray, Image
     
     def _setup_tray(self):
         """Setup system tray icon"""
-        if not TRAY_AVAILABLE:
+        tray_modules = self._maybe_import_tray()
+        if tray_modules is None:
             return
+        pystray, Image = tray_modules
         
-        # Create a simple icon (green circle)
-        def create_icon():
-            img = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            draw.ellipse([8, 8, 56, 56], fill=(76, 175, 80, 255))
-            draw.text((22, 18), "D", fill=(255, 255, 255, 255))
-            return img
+        # The icon never changes while running, so it is decoded once here and never redrawn
+        icon_image = Image.open(io.BytesIO(base64.b64decode(_TRAY_ICON_PNG)))
         
         menu = pystray.Menu(
             pystray.MenuItem("Show", self._show_window, default=True),
             pystray.MenuItem("Exit", self._exit_app)
         )
         
-        self.tray_icon = pystray.Icon("Dolphin", create_icon(), "Dolphin - Volume Limiter", menu)
+        self.tray_icon = pystray.Icon("Dolphin", icon_image, "Dolphin - Volume Limiter", menu)
         
         # Run tray icon in separate thread
         tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
@@ -1608,27 +1967,37 @@ class DolphinGUI:
     
     def _show_window(self, icon=None, item=None):
         """Show the main window"""
-        self.root.after(0, self._do_show_window)
+        if not self._show_pending:
+            self._show_pending = True
+            self.root.after_idle(self._do_show_window)
     
     def _do_show_window(self):
         """Actually show the window (must be called from main thread)"""
+        self._show_pending = False
+        self._visible = True
         self.root.deiconify()
         self.root.lift()
         self.root.focus_force()
     
     def _exit_app(self, icon=None, item=None):
         """Exit the application"""
-        self.root.after(0, self._do_exit)
+        if not self._exit_pending:
+            self._exit_pending = True
+            self.root.after_idle(self._do_exit)
     
     def _do_exit(self):
         """Actually exit (must be called from main thread)"""
         self._exiting = True
+        self._flush_settings()
+        self._flush_registry()
         if self._hotkeys:
             self._hotkeys.stop()
+        self._remember_geometry()
         self.limiter.save_settings()
         self.limiter.stop()
         if self.tray_icon:
             self.tray_icon.stop()
+        self._submit_graph_fill(None)
         self.root.destroy()
     
     def _on_closing(self):